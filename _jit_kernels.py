@@ -0,0 +1,78 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# -------------------------
+# Numba kernels
+# -------------------------
+# Kept serial: Streamlit runs each session's script in its own thread,
+# which numba's parallel threading layer does not tolerate.
+if njit is not None:
+
+    @njit(cache=True)
+    def outlier_counts(arr, lower, upper):
+        n_rows, n_cols = arr.shape
+        out = np.zeros(n_cols, np.int64)
+        for j in range(n_cols):
+            count = 0
+            for i in range(n_rows):
+                value = arr[i, j]
+                if value < lower[j] or value > upper[j]:
+                    count += 1
+            out[j] = count
+        return out
+
+    @njit(cache=True)
+    def null_negative_counts(arr):
+        n_rows, n_cols = arr.shape
+        nulls = np.zeros(n_cols, np.int64)
+        negatives = np.zeros(n_cols, np.int64)
+        for j in range(n_cols):
+            n_null = 0
+            n_neg = 0
+            for i in range(n_rows):
+                value = arr[i, j]
+                if np.isnan(value):
+                    n_null += 1
+                elif value < 0:
+                    n_neg += 1
+            nulls[j] = n_null
+            negatives[j] = n_neg
+        return nulls, negatives
+
+    @njit(cache=True)
+    def count_violations(a, b):
+        count = 0
+        for i in range(a.size):
+            if a[i] < b[i]:
+                count += 1
+        return count
+
+    # Compile once at import so the first audit doesn't pay JIT latency
+    _warm = np.array([-1.0, 0.0, np.nan, 2.0])
+    _bounds = np.zeros(2)
+    _matrix = np.asfortranarray(_warm.reshape(-1, 2))
+    outlier_counts(_matrix, _bounds, _bounds + 1.0)
+    null_negative_counts(_matrix)
+    count_violations(_warm, _warm[::-1].copy())
+
+# -------------------------
+# NumPy fallbacks
+# -------------------------
+else:
+
+    def outlier_counts(arr, lower, upper):
+        return np.count_nonzero((arr < lower) | (arr > upper), axis=0)
+
+    def null_negative_counts(arr):
+        return (
+            np.count_nonzero(np.isnan(arr), axis=0),
+            np.count_nonzero(arr < 0, axis=0)
+        )
+
+    def count_violations(a, b):
+        return int(np.count_nonzero(a < b))
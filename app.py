@@ -1,7 +1,9 @@
+import io
+import copy
+import hashlib
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 from model import GuardianAuditor
 
 # -------------------------------------------------
@@ -46,6 +48,9 @@ if "use_sample_data" not in st.session_state:
 if "cleaned_df" not in st.session_state:
     st.session_state.cleaned_df = None
 
+if "cleaned_csv" not in st.session_state:
+    st.session_state.cleaned_csv = None
+
 # -------------------------------------------------
 # SIDEBAR
 # -------------------------------------------------
@@ -53,7 +58,6 @@ st.sidebar.header("Data Configuration")
 
 if st.sidebar.button("Load Enterprise Sample Dataset"):
     st.session_state.use_sample_data = True
-    st.session_state.cleaned_df = None
 
 st.sidebar.markdown("OR")
 
@@ -61,43 +65,358 @@ uploaded_file = st.sidebar.file_uploader("Upload CSV", type=["csv"])
 
 if uploaded_file is not None:
     st.session_state.use_sample_data = False
-    st.session_state.cleaned_df = None
+
+# -------------------------------------------------
+# CACHED LOADERS
+# -------------------------------------------------
+def csv_header(file_bytes: bytes) -> list:
+    # Column names as the default engine reports them ("a", "a.1" for a
+    # repeated header); load_csv guarantees the loaded frame uses the same
+    return pd.read_csv(io.BytesIO(file_bytes), nrows=0).columns.tolist()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_csv_header(name: str, size: int, file_id: str, _file) -> list:
+    return csv_header(_file.getvalue())
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_csv(name: str, size: int, file_id: str, usecols, _file) -> pd.DataFrame:
+    # Keyed on O(1) upload metadata; the leading underscore keeps Streamlit
+    # from hashing the file contents on every rerun.
+    file_bytes = _file.getvalue()
+    usecols = list(usecols) if usecols else None
+    expected = [
+        col for col in csv_header(file_bytes)
+        if usecols is None or col in usecols
+    ]
+
+    # Arrow's multithreaded parser keeps strings out of Python object arrays.
+    # It rejects short rows and keeps repeated header names as-is, so fall
+    # back to the default engine (which pads with NaN and renames repeats to
+    # "a.1") on any parse failure, when its columns differ from the header
+    # the column picker showed, and when pyarrow is unavailable.
+    try:
+        df = pd.read_csv(
+            io.BytesIO(file_bytes),
+            usecols=usecols,
+            engine="pyarrow",
+            dtype_backend="pyarrow"
+        )
+    except (ImportError, ValueError, KeyError):
+        df = None
+
+    if df is None or df.columns.tolist() != expected:
+        df = pd.read_csv(io.BytesIO(file_bytes), usecols=usecols)
+
+    # Integer columns rarely need 64 bits; floats keep full precision.
+    # By position, so a label can never select more than one column.
+    for i, dtype in enumerate(df.dtypes):
+        if pd.api.types.is_integer_dtype(dtype):
+            df.isetitem(i, pd.to_numeric(df.iloc[:, i], downcast="integer"))
+
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def make_sample(n: int = 1500) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+
+    revenue = rng.normal(8000, 2500, n).round(2)
+    cost = rng.normal(5500, 1800, n).round(2)
+    category = rng.choice(
+        ["Electronics", "Furniture", "Clothing", "Sports"], n
+    ).astype(object)
+
+    # Inject quality issues
+    revenue[rng.choice(n, 60, replace=False)] = -200
+    cost[rng.choice(n, 50, replace=False)] = np.nan
+    category[rng.choice(n, 30, replace=False)] = None
+
+    df = pd.DataFrame({
+        "Transaction_ID": np.arange(10000, 10000 + n),
+        "Customer_ID": rng.integers(1000, 5000, n),
+        "Region": pd.Categorical(
+            rng.choice(["North", "South", "East", "West"], n)
+        ),
+        "Category": pd.Categorical(category),
+        "Revenue": revenue,
+        "Cost": cost,
+        "Discount": rng.uniform(0, 0.35, n).round(2),
+        "Order_Date": pd.date_range("2023-01-01", periods=n, freq="D")
+    })
+
+    # Repeat the first 12 rows as duplicates with a single take
+    idx = np.concatenate([np.arange(n), np.arange(12)])
+    return df.iloc[idx].reset_index(drop=True)
+
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    # Arrow's C++ writer emits UTF-8 bytes directly, avoiding the
+    # str -> bytes double allocation of to_csv().encode(). Its output
+    # differs from to_csv: headers and text fields are always quoted,
+    # booleans are lowercase true/false, whole-number floats drop the ".0",
+    # and timestamps always include the time of day, with a fractional part
+    # for sub-second-resolution columns (dates stay YYYY-MM-DD). Mixed-type
+    # object columns that Arrow cannot convert fall back to to_csv.
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pv
+    except ImportError:
+        return df.to_csv(index=False).encode("utf-8")
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        buf = io.BytesIO()
+        pv.write_csv(table, buf, pv.WriteOptions(quoting_style="needed"))
+    except pa.ArrowException:
+        return df.to_csv(index=False).encode("utf-8")
+
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def df_fingerprint(load_key: str, _df: pd.DataFrame) -> str:
+    # Content hash computed once per load; every downstream cache is keyed
+    # on it, so re-uploading identical data reuses all cached results.
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(zip(_df.columns, _df.dtypes.astype(str)))).encode())
+    digest.update(pd.util.hash_pandas_object(_df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def schema_summary(data_key: str, _df: pd.DataFrame) -> pd.DataFrame:
+    # nunique and deep memory_usage hash/walk every cell; do it once per frame
+    return pd.DataFrame({
+        "Data Type": _df.dtypes.astype(str),
+        "Unique Values": _df.nunique(),
+        "Memory Usage (KB)": (_df.memory_usage(deep=True) / 1024).round(2)
+    })
+
+
+@st.cache_data(show_spinner=False)
+def box_stats(data_key: str, columns: tuple, _auditor: GuardianAuditor) -> dict:
+    # Only quartiles, whiskers and the outlier points go to the browser,
+    # not every row of the selected columns. Read from the auditor's numeric
+    # matrix so the chart and the audit's outlier counts always agree.
+    stats = {}
+    matrix = _auditor.get_numeric_matrix(columns)
+
+    for i, col in enumerate(columns):
+        values = matrix[:, i]
+        values = values[~np.isnan(values)]
+
+        if values.size == 0:
+            continue
+
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        is_outlier = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+        inliers = values[~is_outlier]
+
+        stats[col] = {
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "lowerfence": inliers.min(),
+            "upperfence": inliers.max(),
+            "outliers": values[is_outlier]
+        }
+
+    return stats
+
+
+@st.cache_data(show_spinner=False)
+def build_missing_fig(columns: tuple, missing_pct: tuple):
+    import plotly.express as px
+
+    fig = px.bar(
+        x=columns,
+        y=missing_pct,
+        text=missing_pct,
+        color=missing_pct,
+        labels={"x": "Column", "y": "Missing %", "color": "Missing %"},
+        color_continuous_scale="Blues",
+        template="plotly_white"
+    )
+
+    fig.update_traces(texttemplate='%{text}%', textposition='outside')
+    fig.update_layout(
+        height=500,
+        yaxis_title="Missing Percentage (%)",
+        xaxis_title="Columns",
+        showlegend=False,
+        uirevision="static"
+    )
+
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def build_auditor(data_key: str, _df: pd.DataFrame) -> GuardianAuditor:
+    # Keyed on the dataset key so reruns skip hashing the whole frame.
+    # Null counts are filled here so every session copy shares them.
+    auditor = GuardianAuditor(_df)
+    auditor.get_null_counts()
+    return auditor
+
+
+def session_auditor(auditor: GuardianAuditor) -> GuardianAuditor:
+    # Shallow copy: shares the cached frame but owns its report_summary,
+    # so sessions and cached checks never write into each other's scores.
+    local = copy.copy(auditor)
+    local.report_summary = {}
+    return local
+
+
+@st.cache_data(show_spinner=False)
+def run_check(data_key: str, method: str, args: tuple, _auditor: GuardianAuditor):
+    # Memoized per dataset and arguments; returns the recorded scores too so
+    # cache hits can rebuild report_summary without rerunning the check.
+    local = session_auditor(_auditor)
+    result = getattr(local, method)(*args)
+    return result, local.report_summary
+
+
+@st.cache_data(show_spinner=False)
+def run_numeric_checks(data_key: str, numeric_cols: tuple, _auditor: GuardianAuditor):
+    local = session_auditor(_auditor)
+
+    # Sliced from the auditor's numeric matrix, converted once per dataset
+    numeric_matrix = local.get_numeric_matrix(numeric_cols)
+
+    result = local.check_numeric_matrix(numeric_matrix, list(numeric_cols))
+    return result, local.report_summary
+
+
+# -------------------------------------------------
+# FRAGMENTS
+# -------------------------------------------------
+@st.fragment
+def render_dataset_preview(df: pd.DataFrame):
+    # Moving the slider reruns only this fragment, not the whole audit
+    max_preview = min(len(df), 10000)
+
+    if max_preview > 100:
+        n_preview = st.slider(
+            "Preview rows",
+            100,
+            max_preview,
+            min(1000, max_preview)
+        )
+    else:
+        n_preview = max_preview
+
+    # Only a bounded slice is serialized to the browser
+    st.caption(f"Showing {n_preview:,} of {len(df):,} rows")
+    st.dataframe(df.head(n_preview), use_container_width=True, height=500)
+
+
+@st.fragment
+def render_remediation(df: pd.DataFrame, auditor: GuardianAuditor, key_cols: list):
+    # Cleaning widgets rerun only this fragment, not the audit above
+    st.subheader("Apply Cleaning Rules")
+
+    drop_dupes = st.checkbox("Remove duplicate rows")
+    null_option = st.selectbox(
+        "Handle missing values",
+        ["Do Nothing", "Drop rows with nulls", "Fill numeric with 0 & text with 'Unknown'"]
+    )
+
+    if st.button("Apply Cleaning"):
+
+        # Each step returns a new frame, so the source is only copied when
+        # the in-place fill would otherwise mutate it.
+        clean_df = df
+
+        if drop_dupes:
+            # Reuses the mask the uniqueness audit already hashed
+            clean_df = clean_df[
+                ~auditor.get_duplicate_mask(key_cols)
+            ].reset_index(drop=True)
+
+        if null_option == "Drop rows with nulls":
+            clean_df = clean_df.dropna()
+
+        elif null_option == "Fill numeric with 0 & text with 'Unknown'":
+            if clean_df is df:
+                clean_df = df.copy()
+
+            fill_map = {}
+            for col, dtype in clean_df.dtypes.items():
+                if pd.api.types.is_numeric_dtype(dtype):
+                    fill_map[col] = 0
+                elif isinstance(dtype, pd.CategoricalDtype):
+                    if "Unknown" not in dtype.categories:
+                        clean_df[col] = clean_df[col].cat.add_categories("Unknown")
+                    fill_map[col] = "Unknown"
+                elif pd.api.types.is_string_dtype(dtype):
+                    fill_map[col] = "Unknown"
+
+            clean_df.fillna(value=fill_map, inplace=True)
+
+        st.session_state.cleaned_df = clean_df
+        st.session_state.cleaned_csv = to_csv_bytes(clean_df)
+        st.success("Cleaning complete.")
+
+    if st.session_state.cleaned_df is not None:
+
+        st.subheader("Preview of Cleaned Data")
+        st.dataframe(st.session_state.cleaned_df.head(), use_container_width=True)
+
+        st.download_button(
+            label="Download Cleaned CSV",
+            data=st.session_state.cleaned_csv,
+            file_name="guardian_cleaned_data.csv",
+            mime="text/csv",
+            type="primary"
+        )
+        st.caption(
+            "When pyarrow can convert the data, the export uses Arrow's CSV "
+            "writer: headers and text are quoted, booleans are written as "
+            "true/false, and timestamps always include the time of day "
+            "(with fractional seconds for sub-second-resolution columns)."
+        )
+
 
 # -------------------------------------------------
 # DATA LOADING
 # -------------------------------------------------
 df = None
+load_key = None
 
 try:
     if uploaded_file is not None:
-        df = pd.read_csv(uploaded_file)
+        header = read_csv_header(
+            uploaded_file.name,
+            uploaded_file.size,
+            uploaded_file.file_id,
+            uploaded_file
+        )
+
+        load_cols = st.sidebar.multiselect(
+            "Columns to Load",
+            header,
+            default=header
+        )
+        usecols = tuple(load_cols) if 0 < len(load_cols) < len(header) else None
+
+        load_key = f"{uploaded_file.file_id}:{usecols}"
+        df = load_csv(
+            uploaded_file.name,
+            uploaded_file.size,
+            uploaded_file.file_id,
+            usecols,
+            uploaded_file
+        )
         if df.empty:
             st.error("Uploaded file is empty.")
             st.stop()
 
     elif st.session_state.use_sample_data:
-
-        np.random.seed(42)
-        n = 1500
-
-        df = pd.DataFrame({
-            "Transaction_ID": np.arange(10000, 10000 + n),
-            "Customer_ID": np.random.randint(1000, 5000, n),
-            "Region": np.random.choice(["North", "South", "East", "West"], n),
-            "Category": np.random.choice(
-                ["Electronics", "Furniture", "Clothing", "Sports"], n
-            ),
-            "Revenue": np.random.normal(8000, 2500, n).round(2),
-            "Cost": np.random.normal(5500, 1800, n).round(2),
-            "Discount": np.random.uniform(0, 0.35, n).round(2),
-            "Order_Date": pd.date_range("2023-01-01", periods=n, freq="D")
-        })
-
-        # Inject quality issues
-        df.loc[np.random.choice(n, 60), "Revenue"] = -200
-        df.loc[np.random.choice(n, 50), "Cost"] = np.nan
-        df.loc[np.random.choice(n, 30), "Category"] = None
-        df = pd.concat([df, df.iloc[:12]])
+        load_key = "sample"
+        df = make_sample()
 
 except Exception as e:
     st.error(f"Error loading data: {e}")
@@ -108,13 +427,22 @@ except Exception as e:
 # -------------------------------------------------
 if df is not None:
 
-    auditor = GuardianAuditor(df)
+    data_key = df_fingerprint(load_key, df)
+
+    # Cleaned output belongs to the data it was built from; drop it only
+    # when the loaded content actually changes, not on every rerun
+    if st.session_state.get("df_fp") != data_key:
+        st.session_state.df_fp = data_key
+        st.session_state.cleaned_df = None
+        st.session_state.cleaned_csv = None
+    auditor = session_auditor(build_auditor(data_key, df))
 
     # Sidebar settings
     st.sidebar.markdown("---")
     st.sidebar.subheader("Audit Settings")
 
-    numeric_cols_available = df.select_dtypes(include=["number"]).columns.tolist()
+    col_list = df.columns.tolist()
+    numeric_cols_available = auditor.numeric_columns
 
     numeric_cols = st.sidebar.multiselect(
         "Numeric Columns",
@@ -124,11 +452,9 @@ if df is not None:
 
     date_col = st.sidebar.selectbox(
         "Date Column",
-        ["None"] + df.columns.tolist()
+        ["None"] + col_list
     )
 
-    col_list = df.columns.tolist()
-
     st.sidebar.markdown("---")
     st.sidebar.subheader("Consistency Rule")
     st.sidebar.caption("Column A must be greater than or equal to Column B")
@@ -136,23 +462,48 @@ if df is not None:
     col_a = st.sidebar.selectbox("Column A", col_list, index=0)
     col_b = st.sidebar.selectbox("Column B", col_list, index=1 if len(col_list) > 1 else 0)
 
-    # Run checks
-    completeness_dict = auditor.check_completeness()
-    dupe_count = auditor.check_uniqueness()
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("Uniqueness Rule")
+    st.sidebar.caption("Leave empty to compare entire rows")
+
+    key_cols = st.sidebar.multiselect("Unique Key Columns (optional)", col_list)
 
-    validity_results = auditor.check_validity(numeric_cols) if numeric_cols else {}
-    outlier_results = auditor.check_accuracy(numeric_cols) if numeric_cols else {}
+    # Run checks (cached per dataset + settings)
+    audit_now = pd.Timestamp.now(tz="UTC")
+
+    completeness_dict, scores = run_check(
+        data_key, "check_completeness", (), auditor
+    )
+    auditor.report_summary.update(scores)
+
+    dupe_count, scores = run_check(
+        data_key, "check_uniqueness", (tuple(key_cols),), auditor
+    )
+    auditor.report_summary.update(scores)
+
+    (validity_results, outlier_results), scores = run_numeric_checks(
+        data_key, tuple(numeric_cols), auditor
+    )
+    auditor.report_summary.update(scores)
 
     if date_col != "None":
-        auditor.check_timeliness(date_col)
+        # Not cached: the score depends on the current date
+        auditor.check_timeliness(date_col, now=audit_now)
+
+    inc_count, scores = run_check(
+        data_key, "check_consistency", (col_a, col_b), auditor
+    )
+    auditor.report_summary.update(scores)
 
-    inc_count = auditor.check_consistency(col_a, col_b)
     overall_score = auditor.get_overall_health_score()
 
     # -------------------------------------------------
     # TOP METRICS
     # -------------------------------------------------
-    total_missing = sum(completeness_dict.values())
+    # The auditor's per-column null counts feed both the metric and the
+    # Profiling chart
+    null_counts = auditor.get_null_counts()
+    total_missing = int(null_counts.sum())
     total_cells = df.shape[0] * df.shape[1]
     missing_pct = round((total_missing / total_cells) * 100, 2)
 
@@ -183,44 +534,19 @@ if df is not None:
         st.subheader("Missing Values by Column")
 
         if completeness_dict:
-            null_df = pd.DataFrame(
-                list(completeness_dict.items()),
-                columns=["Column", "Missing Count"]
-            )
-
-            null_df["Missing %"] = (
-                null_df["Missing Count"] / len(df) * 100
-            ).round(2)
-
-            null_df = null_df.sort_values("Missing %", ascending=False)
+            col_missing_pct = (null_counts / len(df) * 100).round(2)
+            order = np.argsort(-col_missing_pct, kind="stable")
 
-            fig = px.bar(
-                null_df,
-                x="Column",
-                y="Missing %",
-                text="Missing %",
-                color="Missing %",
-                color_continuous_scale="Blues",
-                template="plotly_white"
+            fig = build_missing_fig(
+                tuple(df.columns[order]),
+                tuple(col_missing_pct[order].tolist())
             )
 
-            fig.update_traces(texttemplate='%{text}%', textposition='outside')
-            fig.update_layout(
-                height=500,
-                yaxis_title="Missing Percentage (%)",
-                xaxis_title="Columns",
-                showlegend=False
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key="missing_bar")
 
         st.subheader("Schema Overview")
 
-        schema_df = pd.DataFrame({
-            "Data Type": df.dtypes.astype(str),
-            "Unique Values": df.nunique(),
-            "Memory Usage (KB)": (df.memory_usage(deep=True) / 1024).round(2)
-        })
+        schema_df = schema_summary(data_key, df)
 
         st.dataframe(schema_df, use_container_width=True)
 
@@ -253,15 +579,31 @@ if df is not None:
         st.subheader("Outlier Distribution")
 
         if numeric_cols:
-            fig_box = px.box(
-                df,
-                y=numeric_cols,
-                points="outliers",
-                template="plotly_white"
+            import plotly.graph_objects as go
+
+            stats = box_stats(data_key, tuple(numeric_cols), auditor)
+
+            fig_box = go.Figure(data=[
+                go.Box(
+                    name=col,
+                    q1=[s["q1"]],
+                    median=[s["median"]],
+                    q3=[s["q3"]],
+                    lowerfence=[s["lowerfence"]],
+                    upperfence=[s["upperfence"]],
+                    y=[s["outliers"]],
+                    boxpoints="all"
+                )
+                for col, s in stats.items()
+            ])
+
+            fig_box.update_layout(
+                height=500,
+                template="plotly_white",
+                showlegend=False,
+                uirevision="static"
             )
-
-            fig_box.update_layout(height=500)
-            st.plotly_chart(fig_box, use_container_width=True)
+            st.plotly_chart(fig_box, use_container_width=True, key="outlier_box")
             st.json(outlier_results)
         else:
             st.info("Select numeric columns.")
@@ -270,54 +612,13 @@ if df is not None:
     # TAB 4 — DATA VIEW
     # -------------------------------------------------
     with tab4:
-        st.dataframe(df, use_container_width=True)
+        render_dataset_preview(df)
 
     # -------------------------------------------------
     # TAB 5 — REMEDIATION
     # -------------------------------------------------
     with tab5:
-
-        st.subheader("Apply Cleaning Rules")
-
-        drop_dupes = st.checkbox("Remove duplicate rows")
-        null_option = st.selectbox(
-            "Handle missing values",
-            ["Do Nothing", "Drop rows with nulls", "Fill numeric with 0 & text with 'Unknown'"]
-        )
-
-        if st.button("Apply Cleaning"):
-
-            clean_df = df.copy()
-
-            if drop_dupes:
-                clean_df = clean_df.drop_duplicates()
-
-            if null_option == "Drop rows with nulls":
-                clean_df = clean_df.dropna()
-
-            elif null_option == "Fill numeric with 0 & text with 'Unknown'":
-                num_cols = clean_df.select_dtypes(include=["number"]).columns
-                obj_cols = clean_df.select_dtypes(exclude=["number"]).columns
-                clean_df[num_cols] = clean_df[num_cols].fillna(0)
-                clean_df[obj_cols] = clean_df[obj_cols].fillna("Unknown")
-
-            st.session_state.cleaned_df = clean_df
-            st.success("Cleaning complete.")
-
-        if st.session_state.cleaned_df is not None:
-
-            st.subheader("Preview of Cleaned Data")
-            st.dataframe(st.session_state.cleaned_df.head(), use_container_width=True)
-
-            csv = st.session_state.cleaned_df.to_csv(index=False).encode("utf-8")
-
-            st.download_button(
-                label="Download Cleaned CSV",
-                data=csv,
-                file_name="guardian_cleaned_data.csv",
-                mime="text/csv",
-                type="primary"
-            )
+        render_remediation(df, auditor, key_cols)
 
 else:
     st.info("Upload a dataset or load the enterprise sample dataset to begin.")
@@ -1,11 +1,288 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
 import numpy as np
+from _jit_kernels import count_violations, null_negative_counts, outlier_counts
+
+
+_scratch = threading.local()
+
+# Per-thread cap on pooled workspace; larger buffers are never retained
+SCRATCH_POOL_BYTES = 32 * 1024 * 1024
+
+
+def _scratch_buffer(shape, dtype, order="C"):
+    # Per-thread workspace keyed by (shape, dtype, order), so repeated audits
+    # of same-sized frames reuse memory instead of reallocating it. Contents
+    # are garbage and must not escape the caller.
+    pool = _scratch.__dict__.setdefault("pool", {})
+    key = (tuple(shape), np.dtype(dtype), order)
+
+    buf = pool.get(key)
+    if buf is None:
+        buf = np.empty(shape, dtype=dtype, order=order)
+        if buf.nbytes > SCRATCH_POOL_BYTES:
+            return buf
+
+        # Evict oldest entries until the new buffer fits under the cap
+        while pool and sum(b.nbytes for b in pool.values()) + buf.nbytes > SCRATCH_POOL_BYTES:
+            del pool[next(iter(pool))]
+        pool[key] = buf
+    return buf
+
+
+def _quartiles(values):
+    # Q1/Q3 with pandas' linear interpolation, via O(n) selection not a sort.
+    # np.partition orders NaN last, so the non-NaN ranks are the first n
+    # slots and no NaN-free copy of the column is needed.
+    n = values.size - np.count_nonzero(np.isnan(values))
+    if n == 0:
+        return np.nan, np.nan
+
+    positions = (n - 1) * np.array([0.25, 0.75])
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+
+    selected = _scratch_buffer(values.shape, values.dtype)
+    np.copyto(selected, values)
+    selected.partition(np.unique(np.concatenate([lower, upper])))
+    q1, q3 = selected[lower] + (selected[upper] - selected[lower]) * (positions - lower)
+    return q1, q3
+
+
+def _approx_quartiles(matrix):
+    # t-digest sketches: one streaming pass per column with bounded memory
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    quartiles = np.full((2, matrix.shape[1]), np.nan)
+    for i in range(matrix.shape[1]):
+        column = pa.array(matrix[:, i], from_pandas=True)
+        if column.null_count < len(column):
+            quartiles[:, i] = pc.tdigest(column, q=[0.25, 0.75]).to_numpy(
+                zero_copy_only=False
+            )
+    return quartiles
+
+
+def _column_quartiles(matrix, approximate=False):
+    # Q1/Q3 for every column; NaN-free matrices take one 2-D percentile call
+    if approximate:
+        try:
+            return _approx_quartiles(matrix)
+        except ImportError:
+            pass
+
+    if not np.isnan(matrix).any():
+        return np.percentile(matrix, [25, 75], axis=0)
+
+    return np.array([
+        _quartiles(matrix[:, i]) for i in range(matrix.shape[1])
+    ]).reshape(-1, 2).T
+
+
+def _null_count(series):
+    # Arrow-backed columns carry their null count in the array metadata
+    if isinstance(series.dtype, pd.ArrowDtype):
+        import pyarrow as pa
+        return pa.array(series).null_count
+    return np.count_nonzero(series.isna().to_numpy())
+
+
+def _to_float64(series):
+    # Text columns: Arrow's C float parser is an order of magnitude faster
+    # than to_numeric's per-cell loop, but it rejects the whole column on
+    # any unparseable value, so coerce with pandas in that case.
+    if series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError:
+            pa = None
+
+        if pa is not None:
+            # OverflowError/TypeError: Python ints beyond int64, odd objects
+            try:
+                parsed = pc.cast(pa.array(series, from_pandas=True), pa.float64())
+            except (pa.ArrowException, OverflowError, TypeError):
+                pass
+            else:
+                return parsed.to_numpy(zero_copy_only=False)
+
+    return pd.to_numeric(series, errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+
+
+def _latest_timestamp(series):
+    # Naive datetime64 columns: NaT is the int64 minimum, so a plain max
+    # over the raw buffer skips it without a mask or the Series.max wrapper
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind == "M":
+        stamps = series.to_numpy()
+        if stamps.size == 0:
+            return pd.NaT
+        return pd.Timestamp(stamps.view("i8").max().astype(stamps.dtype))
+    return pd.Timestamp(series.max())
+
+
+# HyperLogLog over 64-bit row hashes: 2**14 one-byte registers (~16 KB,
+# ~0.8% standard error) estimate a distinct count in constant memory
+HLL_PRECISION = 14
+HLL_CHUNK_ROWS = 1 << 20
+
+# Rows StreamingAuditor keeps for its accuracy (IQR) estimate
+SAMPLE_SIZE = 100_000
+
+
+def _bit_length(values):
+    # Exact for uint64: each 32-bit half converts to float64 without rounding
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    with np.errstate(divide="ignore"):
+        high_bits = np.floor(np.log2(high)) + 33
+        low_bits = np.floor(np.log2(low)) + 1
+    return np.where(high > 0, high_bits, np.where(low > 0, low_bits, 0)).astype(np.int64)
+
+
+def _hll_update(registers, hashes):
+    precision = int(registers.size).bit_length() - 1
+    tail_bits = 64 - precision
+
+    index = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+    tail = hashes & np.uint64((1 << tail_bits) - 1)
+    rank = (tail_bits - _bit_length(tail) + 1).astype(np.uint8)
+
+    np.maximum.at(registers, index, rank)
+    return registers
+
+
+def _hll_estimate(registers):
+    m = registers.size
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.ldexp(1.0, -registers.astype(np.int64)))
+
+    # Small-range correction: linear counting while registers are still empty
+    zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)
+    return estimate
+
+
+def _distinct_estimate(frame):
+    # Hashed a chunk at a time so memory stays bounded on very long frames
+    registers = np.zeros(1 << HLL_PRECISION, np.uint8)
+    for start in range(0, len(frame), HLL_CHUNK_ROWS):
+        chunk = frame.iloc[start:start + HLL_CHUNK_ROWS]
+        _hll_update(registers, pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+    return _hll_estimate(registers)
+
+
+_NULL_KEY = object()
+
+
+def _row_keys(frame):
+    # Hashable row tuples that compare like duplicated(): Python equality
+    # already gives -0.0 == 0.0 and 1 != '1'; NaN never equals itself, so
+    # float NaNs (any null, in typed columns) map to one shared sentinel
+    columns = []
+    for _, series in frame.items():
+        values = series.astype(object).to_numpy(copy=True)
+        if series.dtype == object:
+            nulls = np.fromiter(
+                (isinstance(v, float) and v != v for v in values), bool, len(values)
+            )
+        else:
+            nulls = series.isna().to_numpy()
+        values[nulls] = _NULL_KEY
+        columns.append(values)
+    return zip(*columns)
+
+
+def _days_since(latest_date, now=None):
+    # An aware `now` is converted into the column's zone (naive columns are
+    # read as local wall-clock time); a naive `now` is taken to already be
+    # in the column's zone
+    if now is None:
+        now = pd.Timestamp.now(tz=latest_date.tz)
+    elif now.tz is not None:
+        if latest_date.tz is not None:
+            now = now.tz_convert(latest_date.tz)
+        else:
+            now = pd.Timestamp(now.to_pydatetime().astimezone()).tz_localize(None)
+    elif latest_date.tz is not None:
+        now = now.tz_localize(latest_date.tz)
+
+    return (now - latest_date).days
+
+
+@lru_cache(maxsize=32)
+def _numeric_columns(schema):
+    # Keyed on the (column, dtype) schema: repeated audits of same-shaped
+    # batches skip the per-dtype predicate dispatch
+    return tuple(
+        col for col, dtype in schema
+        if pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+    )
+
+
+@lru_cache(maxsize=64)
+def _mean_score(score_items):
+    # Keyed on a frozen (name, score) snapshot of report_summary
+    return round(sum(score for _, score in score_items) / len(score_items), 2)
+
+
+def _overall_score(report_summary):
+    if not report_summary:
+        return 0.0
+
+    return _mean_score(tuple(sorted(report_summary.items())))
+
 
 class GuardianAuditor:
     def __init__(self, df):
-        self.df = df.copy()
+        self.df = df
         self.total_rows = len(df)
         self.report_summary = {}
+        self._null_counts = None
+        self._dup_masks = {}
+        self._parsed_dates = {}
+        self._numeric_cache = {}
+
+        self.numeric_columns = list(_numeric_columns(tuple(self.df.dtypes.items())))
+
+    def get_numeric_matrix(self, columns):
+        # Only the requested columns, each converted once via _as_numeric
+        return self._as_numeric_matrix(list(columns))
+
+    def _as_numeric(self, col):
+        # Each column is coerced once, however many checks read it
+        values = self._numeric_cache.get(col)
+        if values is None:
+            values = _to_float64(self.df[col])
+            self._numeric_cache[col] = values
+        return values
+
+    def _as_numeric_matrix(self, cols, scratch=False):
+        # Column-major so the per-column kernel scans walk contiguous memory
+        shape = (self.total_rows, len(cols))
+        if scratch:
+            values = _scratch_buffer(shape, np.float64, order="F")
+        else:
+            values = np.empty(shape, dtype=np.float64, order="F")
+        for i, col in enumerate(cols):
+            values[:, i] = self._as_numeric(col)
+        return values
+
+    def get_null_counts(self):
+        # Column by column, so no (rows x cols) boolean frame is materialized
+        if self._null_counts is None:
+            self._null_counts = np.array([
+                _null_count(series) for _, series in self.df.items()
+            ], dtype=np.int64)
+        return self._null_counts
 
     # -------------------------
     # Completeness
@@ -14,20 +291,39 @@ class GuardianAuditor:
         if self.total_rows == 0:
             return {}
 
-        null_counts = self.df.isnull().sum()
+        null_counts = self.get_null_counts()
         completeness_pct = ((self.total_rows - null_counts) / self.total_rows) * 100
 
         self.report_summary['completeness'] = float(completeness_pct.mean())
-        return completeness_pct.to_dict()
+        return dict(zip(self.df.columns, completeness_pct.tolist()))
 
     # -------------------------
     # Uniqueness
     # -------------------------
-    def check_uniqueness(self):
+    def get_duplicate_mask(self, subset=None):
+        # Hashing only the key column(s) is far cheaper than whole rows
+        subset = [col for col in subset or [] if col in self.df.columns] or None
+
+        key = tuple(subset) if subset else None
+        if key not in self._dup_masks:
+            self._dup_masks[key] = self.df.duplicated(subset=subset).to_numpy()
+        return self._dup_masks[key]
+
+    def check_uniqueness(self, subset=None, precise=True):
         if self.total_rows == 0:
             return 0
 
-        duplicate_count = int(self.df.duplicated().sum())
+        subset = [col for col in subset or [] if col in self.df.columns] or None
+
+        if precise or (tuple(subset) if subset else None) in self._dup_masks:
+            # Exact, and the same mask remediation drops rows with
+            duplicate_count = int(self.get_duplicate_mask(subset).sum())
+        else:
+            # Approximate: a HyperLogLog sketch instead of an O(n) hash table
+            frame = self.df[subset] if subset else self.df
+            unique_estimate = min(self.total_rows, round(_distinct_estimate(frame)))
+            duplicate_count = self.total_rows - unique_estimate
+
         uniqueness_score = ((self.total_rows - duplicate_count) / self.total_rows) * 100
 
         self.report_summary['uniqueness'] = float(uniqueness_score)
@@ -40,13 +336,26 @@ class GuardianAuditor:
         if self.total_rows == 0 or not numeric_columns:
             return {}
 
-        validity_issues = {}
+        cols = [col for col in numeric_columns if col in self.df.columns]
+
+        # Columns sharing a native numeric dtype are compared as one block in
+        # that dtype (ints need no float cast); the rest are coerced first.
+        # NaN < 0 is False.
+        groups = {}
+        for col in cols:
+            dtype = self.df.dtypes[col]
+            native = isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+            groups.setdefault(dtype if native else None, []).append(col)
 
-        for col in numeric_columns:
-            if col in self.df.columns:
-                numeric_series = pd.to_numeric(self.df[col], errors="coerce")
-                invalid_count = int((numeric_series < 0).sum())
-                validity_issues[col] = invalid_count
+        negative_counts = {}
+        for dtype, group in groups.items():
+            if dtype is None:
+                values = self._as_numeric_matrix(group, scratch=True)
+            else:
+                values = self.df[group].to_numpy()
+            negative_counts.update(zip(group, np.sum(values < 0, axis=0).tolist()))
+
+        validity_issues = {col: negative_counts[col] for col in cols}
 
         total_issues = sum(validity_issues.values())
         validity_score = max(0, 100 - (total_issues / self.total_rows * 100))
@@ -57,39 +366,85 @@ class GuardianAuditor:
     # -------------------------
     # Accuracy (Outlier check)
     # -------------------------
-    def check_accuracy(self, columns=None):
+    def check_accuracy(self, columns=None, approximate=False):
         if self.total_rows == 0 or not columns:
             return {}
 
-        outlier_report = {}
+        cols = [col for col in columns if col in self.df.columns]
 
-        for col in columns:
-            if col in self.df.columns:
-                numeric_series = pd.to_numeric(self.df[col], errors="coerce").dropna()
+        values = self._as_numeric_matrix(cols, scratch=True)
 
-                if len(numeric_series) == 0:
-                    outlier_report[col] = 0
-                    continue
+        Q1, Q3 = _column_quartiles(values, approximate)
+        IQR = Q3 - Q1
 
-                Q1 = numeric_series.quantile(0.25)
-                Q3 = numeric_series.quantile(0.75)
-                IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
 
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
+        counts = outlier_counts(values, lower_bound, upper_bound)
+        outlier_report = dict(zip(cols, counts.tolist()))
 
-                outliers = numeric_series[
-                    (numeric_series < lower_bound) |
-                    (numeric_series > upper_bound)
-                ]
+        total_outliers = sum(outlier_report.values())
+        accuracy_score = max(0, 100 - (total_outliers / self.total_rows * 100))
 
-                outlier_report[col] = int(len(outliers))
+        self.report_summary['accuracy'] = float(accuracy_score)
+        return outlier_report
+
+    # -------------------------
+    # Numeric profile (pre-converted numeric matrix)
+    # -------------------------
+    def audit_numeric(self, matrix, col_names, approximate=False):
+        # Null, negative and IQR stats from one materialized matrix
+        if self.total_rows == 0 or not col_names:
+            return {}
+
+        # Null and negative counts share one fused pass over the matrix
+        null_counts, negative_counts = null_negative_counts(matrix)
+
+        # All-NaN columns yield NaN bounds and therefore zero outliers
+        Q1, Q3 = _column_quartiles(matrix, approximate)
+
+        IQR = Q3 - Q1
+
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+
+        counts = outlier_counts(matrix, lower_bound, upper_bound)
+
+        return {
+            col: {
+                "null_count": int(null_counts[i]),
+                "negative_count": int(negative_counts[i]),
+                "q1": float(Q1[i]),
+                "q3": float(Q3[i]),
+                "outlier_count": int(counts[i])
+            }
+            for i, col in enumerate(col_names)
+        }
+
+    # -------------------------
+    # Validity + Accuracy (from the numeric profile)
+    # -------------------------
+    def check_numeric_matrix(self, matrix, col_names, approximate=False):
+        profile = self.audit_numeric(matrix, col_names, approximate)
+        if not profile:
+            return {}, {}
+
+        validity_issues = {
+            col: stats["negative_count"] for col, stats in profile.items()
+        }
+        outlier_report = {
+            col: stats["outlier_count"] for col, stats in profile.items()
+        }
+
+        total_issues = sum(validity_issues.values())
+        validity_score = max(0, 100 - (total_issues / self.total_rows * 100))
 
         total_outliers = sum(outlier_report.values())
         accuracy_score = max(0, 100 - (total_outliers / self.total_rows * 100))
 
+        self.report_summary['validity'] = float(validity_score)
         self.report_summary['accuracy'] = float(accuracy_score)
-        return outlier_report
+        return validity_issues, outlier_report
 
     # -------------------------
     # Consistency
@@ -101,10 +456,10 @@ class GuardianAuditor:
         if col_a not in self.df.columns or col_b not in self.df.columns:
             return 0
 
-        series_a = pd.to_numeric(self.df[col_a], errors="coerce")
-        series_b = pd.to_numeric(self.df[col_b], errors="coerce")
+        values_a = self._as_numeric(col_a)
+        values_b = self._as_numeric(col_b)
 
-        inconsistent_count = int((series_a < series_b).sum())
+        inconsistent_count = int(count_violations(values_a, values_b))
 
         consistency_score = ((self.total_rows - inconsistent_count) / self.total_rows) * 100
         self.report_summary['consistency'] = float(consistency_score)
@@ -114,37 +469,230 @@ class GuardianAuditor:
     # -------------------------
     # Timeliness
     # -------------------------
-    def check_timeliness(self, date_column=None):
-        if self.total_rows == 0:
+    def get_latest_date(self, date_column):
+        if self.total_rows == 0 or date_column not in self.df.columns:
             return None
 
-        if date_column not in self.df.columns:
-            return None
+        date_series = self._parsed_dates.get(date_column)
 
-        try:
-            date_series = pd.to_datetime(self.df[date_column], errors="coerce")
-            latest_date = date_series.max()
+        if date_series is None:
+            date_series = self.df[date_column]
+            if not pd.api.types.is_datetime64_any_dtype(date_series.dtype):
+                try:
+                    date_series = pd.to_datetime(date_series, errors="coerce", cache=True)
+                except (TypeError, ValueError):
+                    return None
+            self._parsed_dates[date_column] = date_series
 
-            if pd.isna(latest_date):
-                return None
+        # Unparseable values are NaT, so an all-bad column has no max
+        latest_date = _latest_timestamp(date_series)
 
-            days_since_update = (pd.Timestamp.now() - latest_date).days
-            timeliness_score = max(0, 100 - (days_since_update * 2))
+        if pd.isna(latest_date):
+            return None
+        return latest_date
 
-            self.report_summary['timeliness'] = float(timeliness_score)
-            return int(days_since_update)
+    def check_timeliness(self, date_column=None, now=None):
+        latest_date = self.get_latest_date(date_column)
 
-        except Exception:
+        if latest_date is None:
             return None
 
+        days_since_update = _days_since(latest_date, now)
+
+        # Future-dated records count as fresh, not as extra credit
+        timeliness_score = min(100, max(0, 100 - (days_since_update * 2)))
+
+        self.report_summary['timeliness'] = float(timeliness_score)
+        return int(days_since_update)
+
+    # -------------------------
+    # All checks
+    # -------------------------
+    def run_all(self, numeric_columns=None, accuracy_columns=None,
+                consistency_pair=None, date_column=None, key_columns=None,
+                now=None):
+        # Checks touch disjoint state and each writes its own report_summary
+        # key; the pandas/NumPy kernels release the GIL, so they overlap
+        col_a, col_b = consistency_pair or (None, None)
+        tasks = {
+            "completeness": (self.check_completeness, ()),
+            "uniqueness": (self.check_uniqueness, (key_columns,)),
+            "validity": (self.check_validity, (numeric_columns,)),
+            "accuracy": (self.check_accuracy, (accuracy_columns,)),
+            "consistency": (self.check_consistency, (col_a, col_b)),
+            "timeliness": (self.check_timeliness, (date_column, now)),
+        }
+
+        with ThreadPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as pool:
+            futures = {name: pool.submit(fn, *args) for name, (fn, args) in tasks.items()}
+
+        return {name: future.result() for name, future in futures.items()}
+
     # -------------------------
     # Overall Score
     # -------------------------
     def get_overall_health_score(self):
-        if not self.report_summary:
-            return 0.0
+        return _overall_score(self.report_summary)
+
+
+class StreamingAuditor:
+    # Same checks as GuardianAuditor, accumulated batch by batch; every
+    # batch must have the first batch's columns in the same order.
+    # Accuracy is scored on a fixed-size row reservoir (exact while the
+    # stream fits in it; sample_size=None keeps every row instead).
+    # Duplicates are exact by default, with duplicated() semantics, at the
+    # cost of a Python set holding every distinct key row (~100+ B each).
+    # precise=False swaps in a ~16 KB HyperLogLog sketch whose ~0.8% error
+    # is on the *distinct* count: on 100k mostly-unique rows the duplicate
+    # count can be off by several hundred rows, so only use it when
+    # duplicates are a large share of the stream.
+    def __init__(self, numeric_columns=None, consistency_pair=None,
+                 date_column=None, key_columns=None, precise=True,
+                 sample_size=SAMPLE_SIZE, seed=None):
+        self.numeric_columns = list(numeric_columns or [])
+        self.consistency_pair = consistency_pair
+        self.date_column = date_column
+        self.key_columns = list(key_columns or []) or None
+        self.precise = precise
+        self.sample_size = sample_size
+        self.total_rows = 0
+        self.report_summary = {}
+
+        self._null_counts = None
+        self._negative_counts = None
+        self._numeric_chunks = []
+        self._sample = None
+        self._sample_rows = 0
+        self._rng = np.random.default_rng(seed)
+        self._columns = None
+        self._seen_keys = set()
+        self._hll_registers = np.zeros(1 << HLL_PRECISION, np.uint8)
+        self._duplicate_count = 0
+        self._consistency_checked = False
+        self._inconsistent_count = 0
+        self._latest_date = None
+
+    def _sample_rows_from(self, values, rows_before):
+        if self.sample_size is None:
+            self._numeric_chunks.append(values)
+            return
+
+        if self._sample is None:
+            self._sample = np.empty((self.sample_size, values.shape[1]), order="F")
+
+        # Fill free slots first, then Algorithm R: row t of the stream
+        # replaces a random slot with probability sample_size / t
+        free = min(self.sample_size - self._sample_rows, len(values))
+        self._sample[self._sample_rows:self._sample_rows + free] = values[:free]
+        self._sample_rows += free
+
+        rest = values[free:]
+        if len(rest):
+            positions = rows_before + free + np.arange(1, len(rest) + 1)
+            slots = (self._rng.random(len(rest)) * positions).astype(np.int64)
+            keep = slots < self.sample_size
+            self._sample[slots[keep]] = rest[keep]
+
+    def update(self, batch):
+        if self._columns is not None and list(batch.columns) != self._columns:
+            raise ValueError(
+                f"Batch columns {list(batch.columns)} do not match the first "
+                f"batch's columns {self._columns}"
+            )
+
+        auditor = GuardianAuditor(batch)
+        if auditor.total_rows == 0:
+            return self
+
+        if self._columns is None:
+            # The first batch fixes the schema every later batch must share
+            self._columns = list(batch.columns)
+            self.numeric_columns = [
+                col for col in self.numeric_columns if col in batch.columns
+            ]
+            self._null_counts = np.zeros(len(batch.columns), np.int64)
+            self._negative_counts = np.zeros(len(self.numeric_columns), np.int64)
+
+        rows_before = self.total_rows
+        self.total_rows += auditor.total_rows
+        self._null_counts += auditor.get_null_counts()
+
+        # Uniqueness: repeats within the batch, plus rows whose key was
+        # already seen in an earlier batch
+        subset = [col for col in self.key_columns or [] if col in batch.columns] or None
+        frame = batch[subset] if subset else batch
+        if self.precise:
+            in_batch = auditor.get_duplicate_mask(subset)
+            self._duplicate_count += int(in_batch.sum())
+
+            first = frame[~in_batch]
+            seen_before = len(self._seen_keys)
+            distinct_keys = len(first)
+            self._seen_keys.update(_row_keys(first))
+            self._duplicate_count += distinct_keys - (len(self._seen_keys) - seen_before)
+        else:
+            # Constant memory: the sketch is estimated once, in finalize()
+            hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+            _hll_update(self._hll_registers, hashes)
+
+        if self.numeric_columns:
+            values = auditor._as_numeric_matrix(self.numeric_columns)
+            self._negative_counts += null_negative_counts(values)[1]
+            self._sample_rows_from(values, rows_before)
+
+        if self.consistency_pair and all(col in batch.columns for col in self.consistency_pair):
+            self._consistency_checked = True
+            self._inconsistent_count += auditor.check_consistency(*self.consistency_pair)
+
+        if self.date_column:
+            latest_date = auditor.get_latest_date(self.date_column)
+            if latest_date is not None and (
+                self._latest_date is None or latest_date > self._latest_date
+            ):
+                self._latest_date = latest_date
+
+        return self
+
+    def finalize(self, now=None):
+        rows = self.total_rows
+        if rows == 0:
+            return {}
 
-        return round(
-            sum(self.report_summary.values()) / len(self.report_summary),
-            2
-        )
+        if not self.precise:
+            unique_estimate = min(rows, round(_hll_estimate(self._hll_registers)))
+            self._duplicate_count = rows - unique_estimate
+
+        completeness_pct = ((rows - self._null_counts) / rows) * 100
+        self.report_summary['completeness'] = float(completeness_pct.mean())
+        self.report_summary['uniqueness'] = float(((rows - self._duplicate_count) / rows) * 100)
+
+        if self.numeric_columns:
+            total_issues = int(self._negative_counts.sum())
+            self.report_summary['validity'] = float(max(0, 100 - (total_issues / rows * 100)))
+
+            if self.sample_size is None:
+                matrix = np.asfortranarray(np.concatenate(self._numeric_chunks))
+            else:
+                matrix = np.asfortranarray(self._sample[:self._sample_rows])
+
+            Q1, Q3 = _column_quartiles(matrix)
+            IQR = Q3 - Q1
+            counts = outlier_counts(matrix, Q1 - 1.5 * IQR, Q3 + 1.5 * IQR)
+
+            # Scaled up from the reservoir; exact when it holds every row
+            total_outliers = counts.sum() * rows / len(matrix)
+            self.report_summary['accuracy'] = float(max(0, 100 - (total_outliers / rows * 100)))
+
+        if self._consistency_checked:
+            consistency_score = ((rows - self._inconsistent_count) / rows) * 100
+            self.report_summary['consistency'] = float(consistency_score)
+
+        if self._latest_date is not None:
+            days_since_update = _days_since(self._latest_date, now)
+            timeliness_score = min(100, max(0, 100 - (days_since_update * 2)))
+            self.report_summary['timeliness'] = float(timeliness_score)
+
+        return dict(self.report_summary)
+
+    def get_overall_health_score(self):
+        return _overall_score(self.report_summary)